@@ -0,0 +1,119 @@
+import itertools
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+
+from flappy_bird.inference import PopulationNetwork
+from flappy_bird.selection import SELECTION_METHODS
+
+POPULATION_SIZES = [200, 50_000, 1_000_000]
+BASELINE_DRAWS = 1000
+INFERENCE_POPULATION_SIZE = 1000
+HIDDEN_LAYER_SIZES = [[3], [64], [256], [256, 256]]
+PRUNE_THRESHOLDS = [0.98, 0.99, 0.995]
+INFERENCE_REPEATS = 20
+
+
+def benchmark_per_parent(fitnesses: np.ndarray) -> float:
+    """
+    Time selecting parents one at a time, as done per child by the base genetic algorithm. Only a subset of draws is
+    timed and the result is scaled up to the full population.
+
+    Parameters:
+        fitnesses (np.ndarray): Fitness of each member
+
+    Returns:
+        duration (float): Estimated time in seconds to select all parents
+    """
+    _num_draws = min(BASELINE_DRAWS, 2 * len(fitnesses))
+    _start = time.perf_counter()
+    for _ in range(_num_draws):
+        np.random.choice(len(fitnesses), p=fitnesses / np.sum(fitnesses))
+    return (time.perf_counter() - _start) * (2 * len(fitnesses)) / _num_draws
+
+
+def benchmark_selection() -> None:
+    """
+    Compare vectorised selection strategies against selecting parents one at a time.
+    """
+    print("Selection (seconds per generation)")
+    for population_size in POPULATION_SIZES:
+        _fitnesses = np.random.randint(1, 6000, size=population_size).astype(np.float64) ** 2
+        print(f"  Population {population_size}: per parent ~{benchmark_per_parent(_fitnesses):.4f}")
+        for name, method in SELECTION_METHODS.items():
+            _selection = method()
+            _start = time.perf_counter()
+            _selection.select_parents(_fitnesses, population_size)
+            print(f"    {name}: {time.perf_counter() - _start:.4f}")
+
+
+def feedforward_dense(weights: list[np.ndarray], bias: list[np.ndarray], inputs: np.ndarray) -> np.ndarray:
+    """
+    Feed inputs through the dense neural network of every member.
+
+    Parameters:
+        weights (list[np.ndarray]): Weights for each layer with shape (population, outputs, inputs)
+        bias (list[np.ndarray]): Biases for each layer with shape (population, outputs, 1)
+        inputs (np.ndarray): Inputs with shape (inputs, population)
+
+    Returns:
+        outputs (np.ndarray): Outputs with shape (outputs, population)
+    """
+    _vals = inputs.T[..., np.newaxis]
+    for i, (_weights, _bias) in enumerate(zip(weights, bias, strict=True)):
+        _vals = np.matmul(_weights, _vals) + _bias
+        if i < len(weights) - 1:
+            _vals = np.maximum(_vals, 0)
+    return _vals[..., 0].T
+
+
+def time_repeats(func: Callable[[], np.ndarray]) -> float:
+    """
+    Time the average duration of a function, after a warm-up call.
+
+    Parameters:
+        func (Callable[[], np.ndarray]): Function to time
+
+    Returns:
+        duration (float): Average time in seconds
+    """
+    func()
+    _start = time.perf_counter()
+    for _ in range(INFERENCE_REPEATS):
+        func()
+    return (time.perf_counter() - _start) / INFERENCE_REPEATS
+
+
+def benchmark_inference() -> None:
+    """
+    Compare sparse inference of pruned networks against dense inference for a population.
+    """
+    print(f"Inference (milliseconds per frame, population {INFERENCE_POPULATION_SIZE})")
+    for hidden_layer_sizes in HIDDEN_LAYER_SIZES:
+        _sizes = [4, *hidden_layer_sizes, 2]
+        _weights = [
+            np.random.uniform(-1, 1, size=(INFERENCE_POPULATION_SIZE, _out, _in))
+            for _in, _out in itertools.pairwise(_sizes)
+        ]
+        _bias = [np.random.uniform(-0.3, 0.3, size=(INFERENCE_POPULATION_SIZE, _out, 1)) for _out in _sizes[1:]]
+        _inputs = np.random.uniform(-1, 1, size=(4, INFERENCE_POPULATION_SIZE))
+
+        _dense = time_repeats(partial(feedforward_dense, _weights, _bias, _inputs))
+        print(f"  Hidden layers {hidden_layer_sizes}: dense {_dense * 1000:.3f}")
+        for threshold in PRUNE_THRESHOLDS:
+            _pruned = [np.where(np.abs(_w) < threshold, 0, _w) for _w in _weights]
+            _network = PopulationNetwork(_pruned, _bias)
+            assert np.allclose(_network.feedforward(_inputs), feedforward_dense(_pruned, _bias, _inputs))
+            _sparse = time_repeats(partial(_network.feedforward, _inputs))
+            print(
+                f"    threshold {threshold}: sparsity {_network.sparsity:.1%}, "
+                f"sparse layers {_network.num_sparse_layers}/{len(_weights)}, packed {_sparse * 1000:.3f}, "
+                f"speedup x{_dense / _sparse:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    benchmark_selection()
+    benchmark_inference()
@@ -2,17 +2,30 @@ from __future__ import annotations
 
 from typing import cast
 
+import numpy as np
+import pygame
+from numpy.typing import NDArray
+from pygame.locals import K_DOWN, K_LEFT, K_RIGHT, K_UP, KEYDOWN, K_n, K_p
+
 from flappy_bird.flappy_bird_ga import FlappyBirdGA
 from flappy_bird.objects.bird import Bird
 from flappy_bird.objects.pipe import Pipe
 from flappy_bird.pg.app import App
+from flappy_bird.replay import Episode, EpisodeRecorder
 
 
 class FlappyBirdApp(App):
     """
     This class creates a version of Flappy Bird and uses neuroevolution to train AI to play the game.
+
+    Each generation plays on a course of Pipes generated from a new seed. The best Bird of each generation is recorded
+    as an Episode, which can be played back later with `add_replay()`. During playback, LEFT/RIGHT seek backwards and
+    forwards, UP/DOWN change the playback speed, and N/P skip to the next/previous Episode.
     """
 
+    SEEK_SECONDS = 5
+    MAX_PLAYBACK_SPEED = 64
+
     def __init__(self, name: str, width: int, height: int, fps: int, font: str, font_size: int) -> None:
         """
         Initialise FlappyBirdApp.
@@ -27,16 +40,31 @@ class FlappyBirdApp(App):
         """
         super().__init__(name, width, height, fps, font, font_size)
         self._ga: FlappyBirdGA
+        self._recorder: EpisodeRecorder
+        self._hall_of_fame_filepath: str
+        self._hall_of_fame_save_interval: int
         self._game_counter = 0
         self._pipes: list[Pipe] = []
         self._current_pipes = 0
         self._pipe_counter = 0
+        self._course_seed = 0
+        self._course_rng = np.random.default_rng()
         self._bird_x: int
 
+        self._episodes: list[Episode] = []
+        self._episode_index = 0
+        self._decisions: NDArray[np.bool_]
+        self._replay_bird: Bird
+        self._playback_speed = 1
+
     @property
     def max_count(self) -> int:
         return self._ga._lifetime * self._fps
 
+    @property
+    def episode(self) -> Episode:
+        return self._episodes[self._episode_index]
+
     @property
     def closest_pipe(self) -> Pipe:
         """
@@ -88,6 +116,19 @@ class FlappyBirdApp(App):
         self.write_text(f"Generation: {self._ga._generation}", _start_x, _start_y)
         self.write_text(f"Birds alive: {self._ga.num_alive}", _start_x, _start_y * 3)
         self.write_text(f"Score: {int(self._game_counter / self._fps)}", _start_x, _start_y * 4)
+        if self._ga.pruning_enabled:
+            self.write_text(f"Sparsity: {self._ga.sparsity:.1%}", _start_x, _start_y * 5)
+
+    def _write_replay_stats(self) -> None:
+        """
+        Write playback statistics to screen.
+        """
+        _start_x = 20
+        _start_y = 30
+        self.write_text(f"Replay: Generation {self.episode._generation}", _start_x, _start_y)
+        self.write_text(f"Episode: {self._episode_index + 1}/{len(self._episodes)}", _start_x, _start_y * 3)
+        self.write_text(f"Score: {int(self._game_counter / self._fps)}", _start_x, _start_y * 4)
+        self.write_text(f"Speed: x{self._playback_speed}", _start_x, _start_y * 5)
 
     def _add_pipe(self, speed: float) -> None:
         """
@@ -96,9 +137,50 @@ class FlappyBirdApp(App):
         Parameters:
             speed (float): Pipe speed
         """
-        self._pipes.append(Pipe(speed))
+        self._pipes.append(Pipe(speed, self._course_rng))
         self._current_pipes += 1
 
+    def _reset_course(self, seed: int) -> None:
+        """
+        Remove all Pipes and start a new course generated from a seed.
+
+        Parameters:
+            seed (int): Seed used to generate the course of Pipes
+        """
+        self._course_seed = seed
+        self._course_rng = np.random.default_rng(seed)
+        self._game_counter = 0
+        self._pipes = []
+        self._current_pipes = 0
+        self._pipe_counter = 0
+
+    def _update_pipes(self) -> None:
+        """
+        Spawn a new Pipe if required and move all Pipes.
+        """
+        _next_pipe_spawntime = Pipe.get_spawn_time(self._current_pipes)
+        _next_pipe_speed = Pipe.get_speed(self._current_pipes) / self._fps
+        if int(self._pipe_counter) % _next_pipe_spawntime == 0:
+            self._add_pipe(_next_pipe_speed)
+            self._pipe_counter = 0
+
+        for _pipe in self._pipes:
+            _pipe.update()
+
+    def _record_best_bird(self) -> None:
+        """
+        Record the run of the best Bird in the current generation as an Episode.
+        """
+        _fitnesses = [_bird.fitness for _bird in self._ga._population._population]
+        _best_index = int(np.argmax(_fitnesses))
+        _best_bird = self._ga._population._population[_best_index]
+        self._recorder.record_episode(
+            self._ga._generation,
+            self._course_seed,
+            _best_index,
+            min(_best_bird._score + 1, self._game_counter),
+        )
+
     def add_ga(
         self,
         population_size: int,
@@ -111,6 +193,15 @@ class FlappyBirdApp(App):
         weights_range: list[float],
         bias_range: list[float],
         shift_vals: float,
+        selection: str,
+        prune_threshold: float,
+        hall_of_fame_size: int,
+        num_elites: int,
+        novelty_radius: float,
+        replay_directory: str,
+        replay_save_interval: int,
+        hall_of_fame_filepath: str,
+        hall_of_fame_save_interval: int,
     ) -> None:
         """
         Add genetic algorithm to app.
@@ -126,6 +217,15 @@ class FlappyBirdApp(App):
             weights_range (list[float]): Range for random weights
             bias_range (list[float]): Range for random bias
             shift_vals (float): Values to shift weights and biases by
+            selection (str): Name of parent selection strategy
+            prune_threshold (float): Smallest magnitude of weight to keep, or 0 to disable pruning
+            hall_of_fame_size (int): Number of genomes to keep in the archive, or 0 to disable
+            num_elites (int): Number of genomes from the archive to reinject each generation
+            novelty_radius (float): Distance within which archived genomes are treated as the same entry
+            replay_directory (str): Directory to save recorded Episodes to
+            replay_save_interval (int): Number of generations between saving Episodes
+            hall_of_fame_filepath (str): Path to save archive of fittest genomes to
+            hall_of_fame_save_interval (int): Number of generations between saving archive
         """
         self._bird_x = bird_x
         self._ga = FlappyBirdGA.create(
@@ -139,36 +239,170 @@ class FlappyBirdApp(App):
             weights_range,
             bias_range,
             shift_vals,
+            selection,
+            prune_threshold,
+            hall_of_fame_size,
+            num_elites,
+            novelty_radius,
         )
+        self._recorder = EpisodeRecorder(population_size, replay_directory, replay_save_interval)
+        self._hall_of_fame_filepath = hall_of_fame_filepath
+        self._hall_of_fame_save_interval = hall_of_fame_save_interval
+        self._reset_course(self._new_course_seed())
+
+    def add_replay(self, directory: str, bird_x: int, bird_y: int, bird_size: int) -> None:
+        """
+        Load recorded Episodes to play back instead of training. The app must use the same configuration as when the
+        Episodes were recorded.
+
+        Parameters:
+            directory (str): Directory to load Episodes from
+            bird_x (int): x coordinate of Bird's start position
+            bird_y (int): y coordinate of Bird's start position
+            bird_size (int): Size of Bird
+        """
+        episodes = EpisodeRecorder.load(directory)
+        if not episodes:
+            msg = f"No Episodes to play back in {directory}"
+            raise ValueError(msg)
+
+        self._bird_x = bird_x
+        self._episodes = episodes
+        self._replay_bird = Bird(bird_x, bird_y, bird_size, [], (0, 0), (0, 0))
+        self._load_episode(0)
+
+    def save_episodes(self) -> None:
+        """
+        Save the Episodes recorded since the last periodic save.
+        """
+        self._recorder.save()
+
+    def save_hall_of_fame(self) -> None:
+        """
+        Save the archive of fittest genomes found during training.
+        """
+        self._ga.save_hall_of_fame(self._hall_of_fame_filepath)
+
+    @staticmethod
+    def _new_course_seed() -> int:
+        """
+        Generate a seed for a new course of Pipes.
+
+        Returns:
+            seed (int): Course seed
+        """
+        return int(np.random.randint(np.iinfo(np.int32).max))
+
+    def _load_episode(self, index: int) -> None:
+        """
+        Start playing back an Episode from the beginning.
+
+        Parameters:
+            index (int): Index of Episode to play back
+        """
+        self._episode_index = index % len(self._episodes)
+        self._decisions = self.episode.decisions
+        self._reset_course(self.episode._seed)
+        self._replay_bird.reset()
+
+    def _step_replay(self) -> None:
+        """
+        Advance the Episode by a single frame using the recorded jump decisions.
+        """
+        self._update_pipes()
+        self._replay_bird.update(self.closest_pipe, jump=self._decisions[self._game_counter])
+        self._game_counter += 1
+        self._pipe_counter += 1
+
+    def _seek(self, frame: int) -> None:
+        """
+        Move the Episode to a given frame by rebuilding the course without drawing.
+
+        Parameters:
+            frame (int): Frame to seek to
+        """
+        frame = min(max(frame, 0), self.episode._num_frames)
+        if frame < self._game_counter:
+            self._reset_course(self.episode._seed)
+            self._replay_bird.reset()
+
+        while self._game_counter < frame:
+            self._step_replay()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Handle playback controls.
+
+        Parameters:
+            event (Event): Pygame event
+        """
+        if not self._episodes or event.type != KEYDOWN:
+            return
+
+        _seek_frames = self.SEEK_SECONDS * self._fps
+        if event.key == K_RIGHT:
+            self._seek(self._game_counter + _seek_frames)
+        elif event.key == K_LEFT:
+            self._seek(self._game_counter - _seek_frames)
+        elif event.key == K_UP:
+            self._playback_speed = min(self._playback_speed * 2, self.MAX_PLAYBACK_SPEED)
+        elif event.key == K_DOWN:
+            self._playback_speed = max(self._playback_speed // 2, 1)
+        elif event.key == K_n:
+            self._load_episode(self._episode_index + 1)
+        elif event.key == K_p:
+            self._load_episode(self._episode_index - 1)
+
+    def _update_replay(self) -> None:
+        """
+        Play back the current Episode and draw to screen.
+        """
+        if self._game_counter >= self.episode._num_frames:
+            self._load_episode(self._episode_index + 1)
+
+        self._seek(self._game_counter + self._playback_speed)
+
+        for _pipe in self._pipes:
+            _pipe.draw(self.screen)
+
+        self._replay_bird.draw(self.screen)
+        self._write_replay_stats()
 
     def update(self) -> None:
         """
         Run genetic algorithm, update Birds and draw to screen.
         """
+        if self._episodes:
+            self._update_replay()
+            return
+
         if self._game_counter == self.max_count or self._ga.num_alive == 0:
             self._ga._analyse()
+            self._record_best_bird()
+            self._ga.update_hall_of_fame(self._course_seed)
+            if (self._ga._generation + 1) % self._hall_of_fame_save_interval == 0:
+                self.save_hall_of_fame()
             self._ga._evolve()
             self._ga.mutate_birds()
             self._ga.reset()
-            self._game_counter = 0
-            self._pipes = []
-            self._current_pipes = 0
-            self._pipe_counter = 0
+            self._reset_course(self._new_course_seed())
 
-        _next_pipe_spawntime = Pipe.get_spawn_time(self._current_pipes)
-        _next_pipe_speed = Pipe.get_speed(self._current_pipes) / self._fps
-        if int(self._pipe_counter) % _next_pipe_spawntime == 0:
-            self._add_pipe(_next_pipe_speed)
-            self._pipe_counter = 0
+        self._update_pipes()
 
         for _pipe in self._pipes:
-            _pipe.update()
             _pipe.draw(self.screen)
 
-        for _bird in self._ga._population._population:
-            _bird.update(self.closest_pipe)
+        _closest_pipe = self.closest_pipe
+        _jumps = self._ga.decide_jumps(_closest_pipe)
+        for _bird, _jump in zip(self._ga._population._population, _jumps, strict=True):
+            _bird.update(_closest_pipe, jump=_jump)
             _bird.draw(self.screen)
 
+        self._recorder.record_frame(
+            self._game_counter,
+            np.array([_bird._jumped for _bird in self._ga._population._population]),
+            np.array([_bird._alive for _bird in self._ga._population._population]),
+        )
         self._ga._evaluate()
         self._game_counter += 1
         self._pipe_counter += 1
@@ -3,7 +3,11 @@ from __future__ import annotations
 import numpy as np
 from genetic_algorithm.ga import GeneticAlgorithm
 
+from flappy_bird.hall_of_fame import HallOfFame
+from flappy_bird.inference import PopulationNetwork
 from flappy_bird.objects.bird import Bird
+from flappy_bird.objects.pipe import Pipe
+from flappy_bird.selection import SELECTION_METHODS, Selection
 
 
 class FlappyBirdGA(GeneticAlgorithm):
@@ -16,6 +20,10 @@ class FlappyBirdGA(GeneticAlgorithm):
         birds: list[Bird],
         mutation_rate: float,
         shift_vals: float,
+        selection: Selection,
+        prune_threshold: float,
+        hall_of_fame: HallOfFame | None,
+        num_elites: int,
     ) -> None:
         """
         Initialise FlappyBirdGA with a mutation rate.
@@ -24,16 +32,33 @@ class FlappyBirdGA(GeneticAlgorithm):
             birds (list[Bird]): Population of Birds
             mutation_rate (float): Population mutation rate
             shift_vals (float): Values to shift weights and biases by
+            selection (Selection): Strategy used to select parents
+            prune_threshold (float): Smallest magnitude of weight to keep, or 0 to disable pruning
+            hall_of_fame (HallOfFame | None): Archive of fittest genomes, or None to disable
+            num_elites (int): Number of genomes from the archive to reinject each generation
         """
         super().__init__(birds, mutation_rate)
         self._lifetime: int
         self._shift_vals = shift_vals
+        self._selection = selection
+        self._prune_threshold = prune_threshold
+        self._network: PopulationNetwork = None
+        self._hall_of_fame = hall_of_fame
+        self._num_elites = num_elites
 
     @property
     def num_alive(self) -> int:
         _alive_array = np.array([_bird._alive for _bird in self._population._population])
         return int(np.sum(_alive_array))
 
+    @property
+    def pruning_enabled(self) -> bool:
+        return self._prune_threshold > 0
+
+    @property
+    def sparsity(self) -> float:
+        return self._network.sparsity if self._network else 0.0
+
     @classmethod
     def create(
         cls,
@@ -47,6 +72,11 @@ class FlappyBirdGA(GeneticAlgorithm):
         weights_range: list[float],
         bias_range: list[float],
         shift_vals: float,
+        selection: str,
+        prune_threshold: float,
+        hall_of_fame_size: int,
+        num_elites: int,
+        novelty_radius: float,
     ) -> FlappyBirdGA:
         """
         Create genetic algorithm and configure neural network.
@@ -62,18 +92,118 @@ class FlappyBirdGA(GeneticAlgorithm):
             weights_range (list[float]): Range for random weights
             bias_range (list[float]): Range for random bias
             shift_vals (float): Values to shift weights and biases by
+            selection (str): Name of parent selection strategy
+            prune_threshold (float): Smallest magnitude of weight to keep, or 0 to disable pruning
+            hall_of_fame_size (int): Number of genomes to keep in the archive, or 0 to disable
+            num_elites (int): Number of genomes from the archive to reinject each generation
+            novelty_radius (float): Distance within which archived genomes are treated as the same entry
 
         Returns:
             flappy_bird (FlappyBirdGA): Flappy Bird app
         """
+        birds = [Bird(x, y, size, hidden_layer_sizes, weights_range, bias_range) for _ in range(population_size)]
+        hall_of_fame = None
+        if hall_of_fame_size > 0:
+            hall_of_fame = HallOfFame(hall_of_fame_size, birds[0].genome.size, novelty_radius)
+
         flappy_bird = cls(
-            [Bird(x, y, size, hidden_layer_sizes, weights_range, bias_range) for _ in range(population_size)],
+            birds,
             mutation_rate,
             shift_vals,
+            SELECTION_METHODS[selection](),
+            prune_threshold,
+            hall_of_fame,
+            num_elites,
         )
         flappy_bird._lifetime = lifetime
+        flappy_bird._prune_birds()
         return flappy_bird
 
+    def _prune_birds(self) -> None:
+        """
+        Prune all Birds and pack their neural networks for sparse inference, if pruning is enabled.
+        """
+        if not self.pruning_enabled:
+            return
+
+        for _bird in self._population._population:
+            _bird.prune(self._prune_threshold)
+        self._network = PopulationNetwork.from_birds(self._population._population)
+
+    def _inject_elites(self) -> None:
+        """
+        Replace the chromosomes of the first Birds with the fittest genomes in the archive.
+        """
+        if not self._hall_of_fame:
+            return
+
+        _elites = self._hall_of_fame.best(self._num_elites)
+        for _bird, _genome in zip(self._population._population, _elites, strict=False):
+            _bird.genome = _genome
+
+    def update_hall_of_fame(self, seed: int) -> None:
+        """
+        Add the fittest Birds of the current generation to the archive.
+
+        Parameters:
+            seed (int): Seed of the course played by the current generation
+        """
+        if not self._hall_of_fame:
+            return
+
+        _birds = self._population._population
+        _fitnesses = np.array([_bird.fitness for _bird in _birds], dtype=np.float64)
+        for _index in self._hall_of_fame.candidates(_fitnesses):
+            self._hall_of_fame.add(_birds[_index].genome, _fitnesses[_index], self._generation, seed)
+
+    def save_hall_of_fame(self, filepath: str) -> None:
+        """
+        Save the archive of fittest genomes, if enabled.
+
+        Parameters:
+            filepath (str): Path to save archive to
+        """
+        if not self._hall_of_fame:
+            return
+
+        self._hall_of_fame.save(filepath)
+
+    def decide_jumps(self, closest_pipe: Pipe) -> list[bool | None]:
+        """
+        Determine whether or not each Bird should jump. With pruning enabled, the decisions for the whole population
+        are made with a single packed feedforward. Otherwise each Bird uses its own neural network.
+
+        Parameters:
+            closest_pipe (Pipe): Pipe closest to the Birds
+
+        Returns:
+            jumps (list[bool | None]): Jump decision for each Bird, or None if the Bird should decide itself
+        """
+        _birds = self._population._population
+        if not self.pruning_enabled:
+            return [None] * len(_birds)
+
+        for _bird in _birds:
+            _bird._closest_pipe = closest_pipe
+        _outputs = self._network.feedforward(np.hstack([_bird.nn_input for _bird in _birds]))
+        return (_outputs[0] < _outputs[1]).tolist()
+
+    def _evolve(self) -> None:
+        """
+        Select parents for every Bird in a single call, crossover their chromosomes, and advance the generation.
+        """
+        _birds = self._population._population
+        _fitnesses = np.array([_bird.fitness for _bird in _birds], dtype=np.float64)
+        _parents = self._selection.select_parents(_fitnesses, len(_birds))
+
+        for _bird, (_index_a, _index_b) in zip(_birds, _parents, strict=True):
+            _bird.crossover(_birds[_index_a], _birds[_index_b], self._mutation_rate)
+
+        for _bird in _birds:
+            _bird.apply_new_chromosome()
+
+        self._generation += 1
+
     def reset(self) -> None:
         """
         Reset all Birds.
@@ -83,7 +213,9 @@ class FlappyBirdGA(GeneticAlgorithm):
 
     def mutate_birds(self) -> None:
         """
-        Mutate all Birds.
+        Mutate all Birds, reinject elites from the archive, and prune their weights, if pruning is enabled.
         """
         for _bird in self._population._population:
             _bird._nn.mutate(self._shift_vals)
+        self._inject_elites()
+        self._prune_birds()
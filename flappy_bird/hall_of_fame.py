@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class HallOfFame:
+    """
+    This class keeps an archive of the fittest genomes seen during training, along with their fitness, the generation
+    they were found in, and the seed of the course they played.
+
+    The archive is stored in preallocated arrays with a fixed capacity, so its memory footprint stays constant however
+    long training runs. Once full, a new genome replaces the least fit entry if it is fitter. If a novelty radius is
+    set, a new genome within that distance of an existing entry competes only with that entry, which stops a single
+    lineage from filling the archive with near-identical copies.
+    """
+
+    def __init__(self, capacity: int, genome_size: int, novelty_radius: float) -> None:
+        """
+        Initialise HallOfFame with a fixed capacity.
+
+        Parameters:
+            capacity (int): Maximum number of genomes to keep
+            genome_size (int): Number of values in each genome
+            novelty_radius (float): Distance within which genomes are treated as the same entry
+        """
+        self._genomes = np.zeros((capacity, genome_size), dtype=np.float64)
+        self._fitnesses = np.full(capacity, -np.inf, dtype=np.float64)
+        self._generations = np.zeros(capacity, dtype=np.int64)
+        self._seeds = np.zeros(capacity, dtype=np.int64)
+        self._count = 0
+        self._novelty_radius = novelty_radius
+
+    @property
+    def capacity(self) -> int:
+        return len(self._fitnesses)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def min_fitness(self) -> float:
+        return float(np.min(self._fitnesses))
+
+    def candidates(self, fitnesses: NDArray) -> NDArray[np.int64]:
+        """
+        Find the members of a population which could enter the archive, fittest first.
+
+        Parameters:
+            fitnesses (NDArray): Fitness of each member
+
+        Returns:
+            candidates (NDArray[np.int64]): Indices of candidate members
+        """
+        _candidates = np.flatnonzero(fitnesses > self.min_fitness)
+        _order = np.argsort(fitnesses[_candidates], kind="stable")[::-1]
+        return _candidates[_order[: self.capacity]]
+
+    def add(self, genome: NDArray, fitness: float, generation: int, seed: int) -> bool:
+        """
+        Add a genome to the archive, evicting an existing entry if required.
+
+        Parameters:
+            genome (NDArray): Genome to add
+            fitness (float): Fitness of genome
+            generation (int): Generation the genome was found in
+            seed (int): Seed of the course the genome played
+
+        Returns:
+            added (bool): Was the genome added to the archive?
+        """
+        _index = self._count if self._count < self.capacity else int(np.argmin(self._fitnesses))
+
+        if self._count > 0:
+            _distances = np.linalg.norm(self._genomes[: self._count] - genome, axis=1)
+            _nearest = int(np.argmin(_distances))
+            if _distances[_nearest] <= self._novelty_radius:
+                _index = _nearest
+
+        if fitness <= self._fitnesses[_index]:
+            return False
+
+        self._genomes[_index] = genome
+        self._fitnesses[_index] = fitness
+        self._generations[_index] = generation
+        self._seeds[_index] = seed
+        self._count = max(self._count, _index + 1)
+        return True
+
+    def best(self, num: int) -> NDArray:
+        """
+        Get the fittest genomes in the archive.
+
+        Parameters:
+            num (int): Maximum number of genomes to get
+
+        Returns:
+            genomes (NDArray): Genomes with shape (num, genome_size), fittest first
+        """
+        _order = np.argsort(self._fitnesses[: self._count], kind="stable")[::-1]
+        return self._genomes[_order[:num]]
+
+    def save(self, filepath: str) -> None:
+        """
+        Save the archive to a file.
+
+        Parameters:
+            filepath (str): Path to save archive to
+        """
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            filepath,
+            genomes=self._genomes[: self._count],
+            fitnesses=self._fitnesses[: self._count],
+            generations=self._generations[: self._count],
+            seeds=self._seeds[: self._count],
+        )
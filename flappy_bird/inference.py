@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from flappy_bird.objects.bird import Bird
+
+
+class PackedLayer:
+    """
+    This class stores the weights of one layer for every member of the population in a single packed array.
+
+    If the weights are sparse enough, only non-zero weights are kept in compressed sparse row (CSR) form. Each row is
+    one output of one member, and holds the positions of the inputs it reads. Inputs and outputs are laid out with one
+    row per member, so each member's weights read a contiguous block of inputs. The layer is evaluated with a gather, a
+    multiply, and a contiguous sum over each row. Otherwise the dense weights are kept and evaluated with a batched
+    matrix multiplication. The sparse path needs several times more memory traffic per weight than the dense path, so
+    it is only faster when few weights remain. `MAX_SPARSE_DENSITY` is set below the measured break-even density.
+    """
+
+    MAX_SPARSE_DENSITY = 0.03
+
+    def __init__(self, weights: NDArray, bias: NDArray) -> None:
+        """
+        Initialise PackedLayer from the dense weights and biases of the population.
+
+        Parameters:
+            weights (NDArray): Weights with shape (population, outputs, inputs)
+            bias (NDArray): Biases with shape (population, outputs)
+        """
+        self._bias = bias
+        self._size = weights.size
+        self._nnz = int(np.count_nonzero(weights))
+        self._weights: NDArray = None
+
+        if self._nnz > self.MAX_SPARSE_DENSITY * self._size:
+            self._weights = weights
+            return
+
+        _population_size, _num_outputs, _num_inputs = weights.shape
+        _index_dtype = np.int32 if _population_size * _num_inputs < np.iinfo(np.int32).max else np.int64
+        _members, _rows, _cols = np.nonzero(weights)
+        _output_idx = _members * _num_outputs + _rows
+
+        self._vals = weights[_members, _rows, _cols]
+        self._input_idx = (_members * _num_inputs + _cols).astype(_index_dtype)
+        self._row_starts = np.flatnonzero(np.diff(_output_idx, prepend=-1))
+        self._row_idx = _output_idx[self._row_starts]
+
+    @property
+    def nnz(self) -> int:
+        return self._nnz
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def sparse(self) -> bool:
+        return self._weights is None
+
+    def feedforward(self, inputs: NDArray) -> NDArray:
+        """
+        Calculate the weighted sum of the inputs for every member.
+
+        Parameters:
+            inputs (NDArray): Inputs with shape (population, inputs)
+
+        Returns:
+            outputs (NDArray): Outputs with shape (population, outputs)
+        """
+        if not self.sparse:
+            return np.matmul(self._weights, inputs[..., np.newaxis])[..., 0] + self._bias
+
+        _outputs = np.zeros(self._bias.size)
+        if self._nnz:
+            _products = self._vals * np.ravel(inputs)[self._input_idx]
+            _outputs[self._row_idx] = np.add.reduceat(_products, self._row_starts)
+        return _outputs.reshape(self._bias.shape) + self._bias
+
+
+class PopulationNetwork:
+    """
+    This class evaluates the neural networks of the whole population at once using packed weights.
+
+    The networks must share the layout used by Bird: ReLU hidden layers followed by a linear output layer. In layers
+    made sparse enough by pruning, zeroed weights are skipped entirely, so the cost of inference scales with the number
+    of non-zero weights rather than the width of the layers.
+    """
+
+    def __init__(self, weights: list[NDArray], bias: list[NDArray]) -> None:
+        """
+        Initialise PopulationNetwork with the weights and biases of each layer.
+
+        Parameters:
+            weights (list[NDArray]): Weights for each layer with shape (population, outputs, inputs)
+            bias (list[NDArray]): Biases for each layer with shape (population, outputs, 1)
+        """
+        self._layers = [PackedLayer(_w, _b[..., 0]) for _w, _b in zip(weights, bias, strict=True)]
+
+    @classmethod
+    def from_birds(cls, birds: list[Bird]) -> PopulationNetwork:
+        """
+        Pack the neural networks of a population of Birds.
+
+        Parameters:
+            birds (list[Bird]): Population of Birds
+
+        Returns:
+            network (PopulationNetwork): Packed population network
+        """
+        _num_layers = len(birds[0].neural_network.weights)
+        return cls(
+            [np.stack([_bird.neural_network.weights[i].vals for _bird in birds]) for i in range(_num_layers)],
+            [np.stack([_bird.neural_network.bias[i].vals for _bird in birds]) for i in range(_num_layers)],
+        )
+
+    @property
+    def sparsity(self) -> float:
+        return 1 - sum(_layer.nnz for _layer in self._layers) / sum(_layer.size for _layer in self._layers)
+
+    @property
+    def num_sparse_layers(self) -> int:
+        return sum(_layer.sparse for _layer in self._layers)
+
+    def feedforward(self, inputs: NDArray) -> NDArray:
+        """
+        Feed inputs through the neural network of every member.
+
+        Parameters:
+            inputs (NDArray): Inputs with shape (inputs, population)
+
+        Returns:
+            outputs (NDArray): Outputs with shape (outputs, population)
+        """
+        _vals = np.ascontiguousarray(inputs.T)
+        for _layer in self._layers[:-1]:
+            _vals = np.maximum(_layer.feedforward(_vals), 0)
+        return self._layers[-1].feedforward(_vals).T
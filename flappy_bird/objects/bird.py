@@ -65,6 +65,7 @@ class Bird(Member):
 
         self._score = 0
         self._alive = True
+        self._jumped = False
         self._colour = np.random.randint(low=0, high=256, size=3)
 
     @property
@@ -103,6 +104,21 @@ class Bird(Member):
         self.neural_network.weights = new_chromosome[0]
         self.neural_network.bias = new_chromosome[1]
 
+    @property
+    def genome(self) -> NDArray:
+        return np.concatenate([_matrix.vals.ravel() for _matrix in [*self.chromosome[0], *self.chromosome[1]]])
+
+    @genome.setter
+    def genome(self, new_genome: NDArray) -> None:
+        _num_weights = len(self.chromosome[0])
+        _matrices = []
+        _start = 0
+        for _matrix in [*self.chromosome[0], *self.chromosome[1]]:
+            _end = _start + _matrix.vals.size
+            _matrices.append(Matrix.from_array(new_genome[_start:_end].reshape(_matrix.vals.shape)))
+            _start = _end
+        self.chromosome = [_matrices[:_num_weights], _matrices[_num_weights:]]
+
     @property
     def fitness(self) -> int:
         return self._score**2
@@ -166,6 +182,18 @@ class Bird(Member):
             weights=[0.998, 0.001, 0.001],
         )
 
+    def prune(self, threshold: float) -> None:
+        """
+        Set weights with a magnitude below a threshold to zero.
+
+        Parameters:
+            threshold (float): Smallest magnitude of weight to keep
+        """
+        self.neural_network.weights = [
+            Matrix.from_array(np.where(np.abs(_weights.vals) < threshold, 0, _weights.vals))
+            for _weights in self.neural_network.weights
+        ]
+
     def reset(self) -> None:
         """
         Reset to start positions.
@@ -174,6 +202,7 @@ class Bird(Member):
         self._y = self._start_y
         self._score = 0
         self._alive = True
+        self._jumped = False
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -186,20 +215,34 @@ class Bird(Member):
             return
         pygame.draw.rect(screen, self._colour.tolist(), self.rect)
 
-    def update(self, closest_pipe: Pipe) -> None:
+    def update(self, closest_pipe: Pipe, *, jump: bool | None = None) -> None:
         """
-        Use neural network to determine whether or not Bird should jump, and kill if it collides with a Pipe.
+        Use neural network to determine whether or not Bird should jump, and kill if it collides with a Pipe. If a jump
+        decision is given, it is used instead of the neural network.
 
         Parameters:
             closest_pipe (Pipe): Pipe closest to Bird
+            jump (bool | None): Whether or not Bird should jump
         """
         if not self._alive:
             return
 
         self._closest_pipe = closest_pipe
-        output = self.neural_network.feedforward(self.nn_input)
+        if jump is None:
+            output = self.neural_network.feedforward(self.nn_input)
+            jump = output[0] < output[1]
+
+        self._step(jump=jump)
+
+    def _step(self, *, jump: bool) -> None:
+        """
+        Apply jump decision, move Bird, and kill if it collides with a Pipe.
 
-        if output[0] < output[1]:
+        Parameters:
+            jump (bool): Whether or not Bird should jump
+        """
+        self._jumped = bool(jump)
+        if self._jumped:
             self._jump()
 
         self._move()
@@ -26,15 +26,16 @@ class Pipe:
     X_LIM: float
     Y_LIM: float
 
-    def __init__(self, speed: float) -> None:
+    def __init__(self, speed: float, rng: np.random.Generator) -> None:
         """
         Initialise Pipe with speed to move across the screen.
 
         Parameters:
             speed (float): Pipe movement speed
+            rng (Generator): Random number generator for the course
         """
         self._x = self.X_LIM
-        self._top_height = np.random.uniform(low=self.SPACING, high=(self.Y_LIM - self.SPACING - self.SPACING))
+        self._top_height = rng.uniform(low=self.SPACING, high=(self.Y_LIM - self.SPACING - self.SPACING))
         self._bottom_height = self.Y_LIM - self._top_height + self.SPACING
         self._speed = speed
 
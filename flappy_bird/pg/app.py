@@ -77,6 +77,14 @@ class App:
         _text = self._pg_font.render(text, 1, (255, 255, 255))
         self._display_surf.blit(_text, (x, y))
 
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Handle a Pygame event other than quitting. Override to respond to user input.
+
+        Parameters:
+            event (Event): Pygame event
+        """
+
     def update(self) -> None:
         """
         Display application information to screen.
@@ -102,6 +110,7 @@ class App:
                     pygame.quit()
                     self._running = False
                     return
+                self.handle_event(event)
 
             self._display_surf.fill((0, 0, 0))
 
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class Episode:
+    """
+    This class stores the run of the best Bird from a single generation.
+
+    An Episode consists of the seed used to generate the course of Pipes and the Bird's jump decisions for each frame,
+    packed into bits. Since the Bird physics and Pipe spawning are deterministic given the course seed, the run can be
+    rebuilt exactly from these decisions without running the neural network.
+    """
+
+    def __init__(self, generation: int, seed: int, num_frames: int, jumps: NDArray[np.uint8]) -> None:
+        """
+        Initialise Episode with a course seed and packed jump decisions.
+
+        Parameters:
+            generation (int): Generation the Episode was recorded in
+            seed (int): Seed used to generate the course of Pipes
+            num_frames (int): Number of frames in the Episode
+            jumps (NDArray[np.uint8]): Bit-packed jump decisions, one bit per frame
+        """
+        self._generation = generation
+        self._seed = seed
+        self._num_frames = num_frames
+        self._jumps = jumps
+
+    @property
+    def decisions(self) -> NDArray[np.bool_]:
+        return np.unpackbits(self._jumps, count=self._num_frames).astype(bool)
+
+    @property
+    def nbytes(self) -> int:
+        return self._jumps.nbytes
+
+
+class EpisodeRecorder:
+    """
+    This class records the jump decisions of the Birds in the population and keeps the run of the best Bird from each
+    generation as an Episode.
+
+    Jump decisions are written into bit-packed chunks of `CHUNK_FRAMES` frames. Each chunk only has rows for the Birds
+    which were alive when it started, since a Bird that has died can no longer outscore those still alive. The buffer
+    therefore costs `CHUNK_FRAMES / 8` bytes per Bird alive at the start of each chunk. In the worst case, where every
+    Bird survives the whole generation, this is `population_size * max_frames / 8` bytes, e.g. 750 MB for 1M Birds
+    over 6000 frames. At the end of each generation the best Bird's rows are copied out and the buffer is cleared.
+
+    Episodes are saved to a directory every `save_interval` generations, as compressed `.npz` shards named by their
+    first generation, and then dropped from memory.
+    """
+
+    CHUNK_FRAMES = 64
+
+    def __init__(self, population_size: int, directory: str, save_interval: int) -> None:
+        """
+        Initialise EpisodeRecorder for a population.
+
+        Parameters:
+            population_size (int): Number of Birds in population
+            directory (str): Directory to save Episodes to
+            save_interval (int): Number of generations between saves
+        """
+        self._population_size = population_size
+        self._directory = Path(directory)
+        self._save_interval = save_interval
+        self._episodes: list[Episode] = []
+        self._chunks: list[tuple[NDArray[np.int64], NDArray[np.uint8]]] = []
+        self._alive = np.ones(population_size, dtype=bool)
+
+    def record_frame(self, frame: int, jumps: NDArray[np.bool_], alive: NDArray[np.bool_]) -> None:
+        """
+        Record the jump decisions of the Birds for a frame.
+
+        Parameters:
+            frame (int): Frame number in current generation
+            jumps (NDArray[np.bool_]): Jump decision for each Bird
+            alive (NDArray[np.bool_]): Whether or not each Bird is alive after the frame
+        """
+        _offset = frame % self.CHUNK_FRAMES
+        if _offset == 0:
+            _members = np.flatnonzero(self._alive)
+            self._chunks.append((_members, np.zeros((len(_members), self.CHUNK_FRAMES // 8), dtype=np.uint8)))
+
+        _members, _bits = self._chunks[-1]
+        _bits[:, _offset >> 3] |= jumps[_members].astype(np.uint8) << (7 - (_offset & 7))
+        self._alive = alive
+
+    def record_episode(self, generation: int, seed: int, index: int, num_frames: int) -> Episode:
+        """
+        Store the run of a Bird as an Episode and clear the buffer for the next generation. The Bird must have been
+        alive for its first `num_frames` frames.
+
+        Parameters:
+            generation (int): Current generation
+            seed (int): Seed used to generate the course of Pipes
+            index (int): Index of the Bird in the population
+            num_frames (int): Number of frames the Bird was alive for
+
+        Returns:
+            episode (Episode): Recorded Episode
+        """
+        _num_chunks = -(-num_frames // self.CHUNK_FRAMES)
+        _rows = [_bits[np.searchsorted(_members, index)] for _members, _bits in self._chunks[:_num_chunks]]
+        episode = Episode(generation, seed, num_frames, np.concatenate(_rows)[: (num_frames + 7) // 8])
+        self._episodes.append(episode)
+
+        self._chunks = []
+        self._alive = np.ones(self._population_size, dtype=bool)
+        if len(self._episodes) >= self._save_interval:
+            self.save()
+        return episode
+
+    def save(self) -> None:
+        """
+        Save Episodes recorded since the last save to a new shard and drop them from memory.
+        """
+        if not self._episodes:
+            return
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        sizes = [_episode.nbytes for _episode in self._episodes]
+        np.savez_compressed(
+            self._directory / f"episodes_{self._episodes[0]._generation:09d}.npz",
+            generations=np.array([_episode._generation for _episode in self._episodes], dtype=np.int64),
+            seeds=np.array([_episode._seed for _episode in self._episodes], dtype=np.int64),
+            num_frames=np.array([_episode._num_frames for _episode in self._episodes], dtype=np.int64),
+            offsets=np.cumsum([0, *sizes], dtype=np.int64),
+            jumps=np.concatenate([_episode._jumps for _episode in self._episodes]),
+        )
+        self._episodes = []
+
+    @staticmethod
+    def load(directory: str) -> list[Episode]:
+        """
+        Load Episodes from all shards in a directory created by `save()`.
+
+        Parameters:
+            directory (str): Directory to load Episodes from
+
+        Returns:
+            episodes (list[Episode]): Recorded Episodes, in order of generation
+        """
+        episodes = []
+        for filepath in sorted(Path(directory).glob("episodes_*.npz")):
+            with np.load(filepath) as data:
+                offsets = data["offsets"]
+                jumps = data["jumps"]
+                episodes.extend(
+                    Episode(int(generation), int(seed), int(num_frames), jumps[offsets[i] : offsets[i + 1]])
+                    for i, (generation, seed, num_frames) in enumerate(
+                        zip(data["generations"], data["seeds"], data["num_frames"], strict=True)
+                    )
+                )
+        return episodes
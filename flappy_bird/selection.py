@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class Selection(ABC):
+    """
+    This class is used to select parents for the next generation from the fitness of the population.
+
+    Override the `select_parents()` method to create a specific selection strategy. Parents for every child are drawn
+    in a single vectorised call rather than one member at a time.
+    """
+
+    @abstractmethod
+    def select_parents(self, fitnesses: NDArray, num_pairs: int) -> NDArray[np.int64]:
+        """
+        Select pairs of parents from the population.
+
+        Parameters:
+            fitnesses (NDArray): Fitness of each member
+            num_pairs (int): Number of pairs of parents to select
+
+        Returns:
+            parents (NDArray[np.int64]): Indices of parents with shape (num_pairs, 2)
+        """
+
+    @staticmethod
+    def _sample(weights: NDArray, num_pairs: int) -> NDArray[np.int64]:
+        """
+        Select pairs of parents with probability proportional to their weights. The cumulative sum of the weights is
+        built once and all parents are drawn from it with a binary search.
+
+        Parameters:
+            weights (NDArray): Non-negative selection weight of each member
+            num_pairs (int): Number of pairs of parents to select
+
+        Returns:
+            parents (NDArray[np.int64]): Indices of parents with shape (num_pairs, 2)
+        """
+        _cumulative = np.cumsum(weights, dtype=np.float64)
+        if _cumulative[-1] <= 0:
+            return np.random.randint(len(weights), size=(num_pairs, 2))
+
+        _samples = np.random.uniform(high=_cumulative[-1], size=(num_pairs, 2))
+        return np.minimum(np.searchsorted(_cumulative, _samples, side="right"), len(weights) - 1)
+
+
+class FitnessProportionalSelection(Selection):
+    """
+    Select members with probability proportional to their fitness.
+    """
+
+    def select_parents(self, fitnesses: NDArray, num_pairs: int) -> NDArray[np.int64]:
+        """
+        Select pairs of parents using fitness as the selection weight.
+
+        Parameters:
+            fitnesses (NDArray): Fitness of each member
+            num_pairs (int): Number of pairs of parents to select
+
+        Returns:
+            parents (NDArray[np.int64]): Indices of parents with shape (num_pairs, 2)
+        """
+        return self._sample(np.maximum(fitnesses, 0), num_pairs)
+
+
+class RankSelection(Selection):
+    """
+    Select members with probability proportional to their rank, where the fittest member has rank N. Members with equal
+    fitness share the average of their ranks, so they are equally likely to be selected.
+    """
+
+    def select_parents(self, fitnesses: NDArray, num_pairs: int) -> NDArray[np.int64]:
+        """
+        Select pairs of parents using rank as the selection weight.
+
+        Parameters:
+            fitnesses (NDArray): Fitness of each member
+            num_pairs (int): Number of pairs of parents to select
+
+        Returns:
+            parents (NDArray[np.int64]): Indices of parents with shape (num_pairs, 2)
+        """
+        _, _groups, _counts = np.unique(fitnesses, return_inverse=True, return_counts=True)
+        _average_ranks = np.cumsum(_counts) - (_counts - 1) / 2
+        return self._sample(_average_ranks[_groups.ravel()], num_pairs)
+
+
+class TournamentSelection(Selection):
+    """
+    Select the fittest of a number of randomly chosen members.
+    """
+
+    def __init__(self, size: int = 3) -> None:
+        """
+        Initialise TournamentSelection with a tournament size.
+
+        Parameters:
+            size (int): Number of members in each tournament
+        """
+        self._size = size
+
+    def select_parents(self, fitnesses: NDArray, num_pairs: int) -> NDArray[np.int64]:
+        """
+        Select pairs of parents by running a tournament for each parent.
+
+        Parameters:
+            fitnesses (NDArray): Fitness of each member
+            num_pairs (int): Number of pairs of parents to select
+
+        Returns:
+            parents (NDArray[np.int64]): Indices of parents with shape (num_pairs, 2)
+        """
+        _entrants = np.random.randint(len(fitnesses), size=(num_pairs, 2, self._size))
+        _winners = np.argmax(np.asarray(fitnesses)[_entrants], axis=2)
+        return np.take_along_axis(_entrants, _winners[..., np.newaxis], axis=2)[..., 0]
+
+
+SELECTION_METHODS: dict[str, type[Selection]] = {
+    "fitness_proportional": FitnessProportionalSelection,
+    "rank": RankSelection,
+    "tournament": TournamentSelection,
+}
@@ -10,6 +10,8 @@ if __name__ == "__main__":
         config = json.load(config_file)
     app_config = config["app"]
     ga_config = config["genetic_algorithm"]
+    replay_config = config["replay"]
+    hall_of_fame_config = config["hall_of_fame"]
 
     fba = FlappyBirdApp.create_game(
         name=app_config["name"],
@@ -19,16 +21,39 @@ if __name__ == "__main__":
         font=app_config["font"],
         font_size=app_config["font_size"],
     )
-    fba.add_ga(
-        population_size=ga_config["population_size"],
-        mutation_rate=ga_config["mutation_rate"],
-        lifetime=ga_config["lifetime"],
-        bird_x=ga_config["bird_x"],
-        bird_y=ga_config["bird_y"],
-        bird_size=ga_config["bird_size"],
-        hidden_layer_sizes=ga_config["hidden_layer_sizes"],
-        weights_range=ga_config["weights_range"],
-        bias_range=ga_config["bias_range"],
-        shift_vals=ga_config["shift_vals"],
-    )
-    fba.run()
+    if replay_config["playback"]:
+        fba.add_replay(
+            directory=replay_config["directory"],
+            bird_x=ga_config["bird_x"],
+            bird_y=ga_config["bird_y"],
+            bird_size=ga_config["bird_size"],
+        )
+    else:
+        fba.add_ga(
+            population_size=ga_config["population_size"],
+            mutation_rate=ga_config["mutation_rate"],
+            lifetime=ga_config["lifetime"],
+            bird_x=ga_config["bird_x"],
+            bird_y=ga_config["bird_y"],
+            bird_size=ga_config["bird_size"],
+            hidden_layer_sizes=ga_config["hidden_layer_sizes"],
+            weights_range=ga_config["weights_range"],
+            bias_range=ga_config["bias_range"],
+            shift_vals=ga_config["shift_vals"],
+            selection=ga_config["selection"],
+            prune_threshold=ga_config["prune_threshold"],
+            hall_of_fame_size=hall_of_fame_config["size"],
+            num_elites=hall_of_fame_config["num_elites"],
+            novelty_radius=hall_of_fame_config["novelty_radius"],
+            replay_directory=replay_config["directory"],
+            replay_save_interval=replay_config["save_interval"],
+            hall_of_fame_filepath=hall_of_fame_config["filepath"],
+            hall_of_fame_save_interval=hall_of_fame_config["save_interval"],
+        )
+
+    try:
+        fba.run()
+    finally:
+        if not replay_config["playback"]:
+            fba.save_episodes()
+            fba.save_hall_of_fame()